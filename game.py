@@ -31,9 +31,23 @@ from wanderingMonster import (
     collision_index,
     draw_monsters,
     load_monster_images,
+    get_scaled_image,
+    SPRITE_CACHE,
 )
+from memoryAccounting import (
+    memory_report,
+    enforce_budgets,
+    budgets_from_env,
+    policy_from_env,
+    format_memory_report,
+    dump_memory_report,
+    MEMORY_REPORT_FILENAME,
+)
+from saveCatalog import list_saves, write_save, rebuild_catalog, field_fits, NAME_BYTES, SLOT_BYTES
 
+# Single-file save from before the save catalog; imported once into a named slot.
 SAVE_FILENAME = "savegame.json"
+LEGACY_SLOT = "legacy"
 import os
 MEDIA_FOLDER = "combat_media"
 
@@ -68,6 +82,13 @@ def get_valid_input(prompt: str, valid_options: list[str]) -> str:
             return choice
         print("Invalid choice. Try again.")
 
+def get_catalog_name(prompt: str, limit: int, default: str = "") -> str:
+    while True:
+        text = input(prompt).strip() or default
+        if field_fits(text, limit):
+            return text
+        print(f"That name is too long (max {limit} bytes). Try a shorter one.")
+
 # ---------------- SHOP ----------------
 def shop_menu(gold: int) -> int:
     items = [
@@ -110,15 +131,63 @@ def shop_menu(gold: int) -> int:
                 print("You cannot afford this item.")
 
 # ---------------- SAVE / LOAD ----------------
-def save_game(health: int, gold: int, map_state: dict, filename: str = SAVE_FILENAME):
+def build_save_data(health: int, gold: int, map_state: dict) -> dict:
     mons = map_state.get("monsters", [])
-    map_state["monsters"] = [m if isinstance(m, dict) else m.to_dict() for m in mons]
-    save_data = {"health": health, "gold": gold, "inventory": inventory, "map_state": map_state}
-    with open(filename, "w") as f:
-        json.dump(save_data, f, indent=4)
-    print(f"Game saved to {filename}!")
+    saved_state = {**map_state, "monsters": [m if isinstance(m, dict) else m.to_dict() for m in mons]}
+    return {"health": health, "gold": gold, "inventory": inventory, "map_state": saved_state}
 
-def load_game(filename: str = SAVE_FILENAME) -> tuple[int, int, dict]:
+def save_game(health: int, gold: int, map_state: dict, name: str, slot: str = "autosave") -> bool:
+    save_data = build_save_data(health, gold, map_state)
+    try:
+        entry = write_save(name, slot, save_data)
+    except (OSError, ValueError) as e:
+        print(f"Could not save the game ({e}). Nothing was saved.")
+        return False
+    print(f"Game saved to slot '{entry.slot}' ({entry.path})!")
+    return True
+
+def import_legacy_save(name: str) -> str | None:
+    """Offer to move the old single-file save into this player's slots."""
+    if not os.path.exists(SAVE_FILENAME):
+        return None
+    print(f"\nFound an old save file ({SAVE_FILENAME}) from before save slots.")
+    print(f"Import it as {name}'s '{LEGACY_SLOT}' slot? Only do this if it is yours.")
+    if get_valid_input("(y/n) > ", ["y", "n"]) == "n":
+        return None
+    try:
+        with open(SAVE_FILENAME, "r") as f:
+            data = json.load(f)
+        entry = write_save(name, LEGACY_SLOT, data)
+        os.replace(SAVE_FILENAME, SAVE_FILENAME + ".imported")
+    except (OSError, ValueError) as e:
+        print(f"Could not import the old save ({e}).")
+        return None
+    print(f"Imported into slot '{entry.slot}'.")
+    return entry.path
+
+def choose_save_slot(name: str) -> str | None:
+    try:
+        entries = list_saves(name)
+    except ValueError as e:
+        print(f"The save catalog is damaged ({e}). Rebuilding it from the save files...")
+        try:
+            print(f"Recovered {rebuild_catalog()} save(s).")
+            entries = list_saves(name)
+        except (OSError, ValueError) as e:
+            print(f"Could not rebuild the save catalog ({e}).")
+            return None
+    except OSError as e:
+        print(f"Could not read the save catalog ({e}).")
+        return None
+    if not entries:
+        return None
+    print(f"\nSave slots for {name}:")
+    for i, entry in enumerate(entries, 1):
+        print(f"{i}) {entry.describe()}")
+    choice = get_valid_input("> ", [str(i) for i in range(1, len(entries)+1)])
+    return entries[int(choice)-1].path
+
+def load_game(filename: str) -> tuple[int, int, dict]:
     try:
         with open(filename, "r") as f:
             data = json.load(f)
@@ -175,8 +244,7 @@ def fight_monster_entity(monster: Monster, health: int, gold: int) -> tuple[int,
 def load_player_image(tile_size: int = DEFAULT_TILE_SIZE) -> None:
     global PLAYER_IMG
     try:
-        PLAYER_IMG = pygame.image.load(os.path.join(MEDIA_FOLDER, "DarkMan.png")).convert_alpha()
-        PLAYER_IMG = pygame.transform.scale(PLAYER_IMG, (tile_size, tile_size))
+        PLAYER_IMG = get_scaled_image("DarkMan.png", tile_size)
     except FileNotFoundError:
         print("Player image 'DarkMan.png' not found in 'combat_media' folder.")
         PLAYER_IMG = None
@@ -298,6 +366,22 @@ def guessing_game(gold: int) -> int:
     print(f"You now have {gold} gold.")
     return gold
 
+# ---------------- DEBUG ----------------
+def show_memory_report(health: int, gold: int, map_state: dict) -> None:
+    global PLAYER_IMG
+    save_data = build_save_data(health, gold, map_state)
+    report = memory_report(inventory, map_state, save_data, extra_surfaces=[PLAYER_IMG])
+    # Nothing is drawn while in town and start_map reloads every sprite, so
+    # trimming may evict all cached sizes.
+    policy = policy_from_env()
+    enforce_budgets(report, budgets_from_env(), policy, keep_sizes=set(),
+                    extra_surfaces=[PLAYER_IMG])
+    if policy == "trim" and PLAYER_IMG is not None and not any(PLAYER_IMG is s for s in SPRITE_CACHE.values()):
+        PLAYER_IMG = None
+    print(format_memory_report(report))
+    dump_memory_report(report)
+    print(f"Full report written to {MEMORY_REPORT_FILENAME}")
+
 # ---------------- MAIN LOOP ----------------
 def main():
     print("Welcome to the Adventure Game!")
@@ -308,13 +392,18 @@ def main():
     choice = get_valid_input("> ", ["1", "2"])
 
     if choice == "1":
-        name = input("Enter your name, brave adventurer: ")
+        name = get_catalog_name("Enter your name, brave adventurer: ", NAME_BYTES)
         health = 30
         gold = 15
         map_state = DEFAULT_MAP_STATE.copy()
     else:
-        name = input("Enter your name for loading: ")
-        health, gold, map_state = load_game()
+        name = get_catalog_name("Enter your name for loading: ", NAME_BYTES)
+        slot_path = choose_save_slot(name) or import_legacy_save(name)
+        if slot_path:
+            health, gold, map_state = load_game(slot_path)
+        else:
+            print(f"No save slots found for {name}. Starting new game.")
+            health, gold, map_state = 30, 15, DEFAULT_MAP_STATE.copy()
 
     print_welcome(name, 40)
 
@@ -327,8 +416,9 @@ def main():
         print("5) Play Guessing Game (Costs 5 Gold)")
         print("6) Save & Quit")
         print("7) Quit without saving")
+        print("8) Memory Report (debug)")
 
-        choice = get_valid_input("> ", ["1","2","3","4","5","6","7"])
+        choice = get_valid_input("> ", ["1","2","3","4","5","6","7","8"])
 
         if choice == "1":
             while True:
@@ -379,12 +469,17 @@ def main():
         elif choice == "5":
             gold = guessing_game(gold)
         elif choice == "6":
-            save_game(health, gold, map_state)
+            slot = get_catalog_name("Save slot name (blank for 'autosave'): ", SLOT_BYTES, "autosave")
+            if not save_game(health, gold, map_state, name, slot):
+                print("Returning to town. Try another slot or quit without saving.")
+                continue
             print("Exiting game. Goodbye!")
             break
         elif choice == "7":
             print("Exiting game without saving. Goodbye!")
             break
+        elif choice == "8":
+            show_memory_report(health, gold, map_state)
 
 if __name__ == "__main__":
     try:
@@ -0,0 +1,206 @@
+# memoryAccounting.py
+# Memory footprint accounting and budgets for the Adventure Game
+
+
+from __future__ import annotations
+import copy
+import json
+import os
+import time
+import tracemalloc
+from typing import Dict, Iterable, List, Optional
+import pygame
+
+import wanderingMonster
+
+MEMORY_REPORT_FILENAME = "memory_report.json"
+
+# ----- Budgets (bytes per subsystem) -----
+DEFAULT_BUDGETS: Dict[str, int] = {
+    "inventory": 64 * 1024,
+    "monsters": 64 * 1024,
+    "assets": 256 * 1024,
+    "save_file": 128 * 1024,
+}
+DEFAULT_POLICY = "warn"
+
+# Overrides, e.g. ADVENTURE_MEMORY_BUDGETS="assets=8192,inventory=4096"
+# and ADVENTURE_MEMORY_POLICY=trim.
+BUDGETS_ENV = "ADVENTURE_MEMORY_BUDGETS"
+POLICY_ENV = "ADVENTURE_MEMORY_POLICY"
+
+def budgets_from_env() -> Dict[str, int]:
+    """Default budgets with any overrides from the budgets environment variable."""
+    budgets = dict(DEFAULT_BUDGETS)
+    for part in os.environ.get(BUDGETS_ENV, "").split(","):
+        if not part.strip():
+            continue
+        name, _, value = part.partition("=")
+        name = name.strip()
+        if name not in DEFAULT_BUDGETS:
+            print(f"Ignoring unknown memory budget '{name}' "
+                  f"(expected one of: {', '.join(DEFAULT_BUDGETS)}).")
+            continue
+        try:
+            budgets[name] = int(value)
+        except ValueError:
+            print(f"Ignoring invalid memory budget '{part.strip()}'.")
+    return budgets
+
+def policy_from_env() -> str:
+    policy = os.environ.get(POLICY_ENV, DEFAULT_POLICY).strip().lower()
+    if policy not in ("warn", "trim"):
+        print(f"Unknown memory policy '{policy}', using '{DEFAULT_POLICY}'.")
+        return DEFAULT_POLICY
+    return policy
+
+# ----- Tracing -----
+# Subsystem sizes are measured on demand (see traced_sizeof), so tracemalloc is
+# never left running during play. Run with PYTHONTRACEMALLOC=1 to also get a
+# whole-session heap summary in reports.
+def traced_sizeof(obj) -> int:
+    """Bytes tracemalloc sees allocated while building a deep copy of obj.
+
+    The copy has the same shape as obj, so the snapshot delta estimates the
+    memory obj itself holds. It is approximate: objects CPython reuses from its
+    free lists are not new allocations. Tracing is started just for the
+    measurement if it is off.
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        clone = copy.deepcopy(obj)
+        after = tracemalloc.take_snapshot()
+        size = sum(stat.size_diff for stat in after.compare_to(before, "filename")
+                   if stat.traceback[0].filename != tracemalloc.__file__)
+        del clone
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return max(size, 0)
+
+def heap_stats(top: int = 5) -> Dict:
+    """Summarize traced Python allocations, grouped by source file."""
+    if not tracemalloc.is_tracing():
+        return {"tracing": False}
+    current, peak = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+    ))
+    by_file = snapshot.statistics("filename")[:top]
+    return {
+        "tracing": True,
+        "current": current,
+        "peak": peak,
+        "top_files": [
+            {"file": stat.traceback[0].filename, "bytes": stat.size, "blocks": stat.count}
+            for stat in by_file
+        ],
+    }
+
+# ----- Size Helpers -----
+def surface_bytes(surface: pygame.Surface | None) -> int:
+    """Bytes of pixel data held by a pygame surface (SDL memory, invisible to tracemalloc)."""
+    if surface is None:
+        return 0
+    return surface.get_pitch() * surface.get_height()
+
+def sprite_bytes_by_size(extra_surfaces: Iterable[pygame.Surface | None] = (),
+                         released: Iterable[pygame.Surface] = ()) -> Dict[int, int]:
+    """Pixel bytes of every live sprite surface, grouped by tile size.
+
+    Counts the sprite cache, the monster image globals and any extra surfaces
+    the caller still holds, each surface once. Surfaces in released are skipped.
+    """
+    sizes: Dict[int, int] = {}
+    seen = {id(surface) for surface in released}
+    for surface in [*wanderingMonster.live_sprites(), *extra_surfaces]:
+        if surface is None or id(surface) in seen:
+            continue
+        seen.add(id(surface))
+        tile_size = surface.get_width()
+        sizes[tile_size] = sizes.get(tile_size, 0) + surface_bytes(surface)
+    return sizes
+
+# ----- Reports -----
+def memory_report(inventory: list, map_state: dict, save_data: Optional[dict] = None,
+                  extra_surfaces: Iterable[pygame.Surface | None] = ()) -> Dict:
+    """Build a machine-readable report of bytes used per subsystem.
+
+    Inventory and monsters are measured with tracemalloc snapshots, assets by
+    surface pixel size, and "save_file" is the projected size of save_data once
+    encoded as a save file (no save buffer is kept in memory between saves).
+    """
+    save_file = len(json.dumps(save_data, indent=4).encode("utf-8")) if save_data is not None else 0
+    assets_by_size = sprite_bytes_by_size(extra_surfaces)
+    subsystems = {
+        "inventory": traced_sizeof(inventory),
+        "monsters": traced_sizeof(map_state.get("monsters", [])),
+        "assets": sum(assets_by_size.values()),
+        "save_file": save_file,
+    }
+    return {
+        "timestamp": time.time(),
+        "subsystems": subsystems,
+        "total": sum(subsystems.values()),
+        "assets_by_tile_size": {str(size): b for size, b in sorted(assets_by_size.items())},
+        "heap": heap_stats(),
+    }
+
+def enforce_budgets(report: Dict, budgets: Optional[Dict[str, int]] = None,
+                    policy: str = "warn", keep_sizes: Optional[set[int]] = None,
+                    extra_surfaces: Iterable[pygame.Surface | None] = ()) -> List[str]:
+    """Compare a report against budgets and return warning messages.
+
+    With policy "trim", an over-budget asset subsystem evicts cached sprite sizes
+    that are not in keep_sizes (defaults to the default tile size), and the
+    report is updated in place. Evicted surfaces are no longer counted even if
+    they are in extra_surfaces, so callers must drop their own references to them.
+    """
+    if policy not in ("warn", "trim"):
+        raise ValueError(f"Unknown budget policy: {policy}")
+    budgets = budgets if budgets is not None else DEFAULT_BUDGETS
+    keep_sizes = keep_sizes if keep_sizes is not None else {wanderingMonster.DEFAULT_TILE_SIZE}
+    messages: List[str] = []
+    subsystems = report["subsystems"]
+
+    for name, limit in budgets.items():
+        used = subsystems.get(name, 0)
+        if used <= limit:
+            continue
+        if name == "assets" and policy == "trim":
+            evicted = wanderingMonster.evict_sprite_sizes(keep_sizes)
+            assets_by_size = sprite_bytes_by_size(extra_surfaces, released=evicted)
+            subsystems["assets"] = sum(assets_by_size.values())
+            report["assets_by_tile_size"] = {str(size): b for size, b in sorted(assets_by_size.items())}
+            report["total"] = sum(subsystems.values())
+            messages.append(
+                f"assets over budget ({used} > {limit} bytes); evicted {len(evicted)} sprite(s), "
+                f"now {subsystems['assets']} bytes"
+            )
+        else:
+            messages.append(f"{name} over budget ({used} > {limit} bytes)")
+
+    report["budget_warnings"] = messages
+    return messages
+
+def format_memory_report(report: Dict) -> str:
+    """Render a report as a short human-readable table."""
+    lines = ["Memory usage by subsystem:"]
+    for name, used in report["subsystems"].items():
+        lines.append(f"  {name:<13} {used:>10,} bytes")
+    lines.append(f"  {'total':<13} {report['total']:>10,} bytes")
+    heap = report.get("heap", {})
+    if heap.get("tracing"):
+        lines.append(f"Python heap: {heap['current']:,} bytes (peak {heap['peak']:,})")
+    for msg in report.get("budget_warnings", []):
+        lines.append(f"WARNING: {msg}")
+    return "\n".join(lines)
+
+def dump_memory_report(report: Dict, filename: str = MEMORY_REPORT_FILENAME) -> None:
+    """Write a report as JSON for monitoring tools."""
+    with open(filename, "w") as f:
+        json.dump(report, f, indent=4)
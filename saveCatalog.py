@@ -0,0 +1,256 @@
+# saveCatalog.py
+# Multi-slot save catalog for the Adventure Game
+#
+# Every save body lives in its own JSON file next to the catalog. A single
+# index file holds one fixed-size binary record per save (player, slot,
+# timestamp, HP, gold and location), so listing slots is an mmap scan and
+# never decodes a save body. Bodies also record their player and slot, so a
+# damaged index can be rebuilt from them.
+
+
+from __future__ import annotations
+import json
+import mmap
+import os
+import re
+import struct
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+SAVE_FOLDER = "saves"
+CATALOG_FILENAME = os.path.join(SAVE_FOLDER, "catalog.idx")
+
+# ----- Index Layout -----
+# Header: magic bytes. Records: player, slot, timestamp, hp, gold, x, y, body number.
+# A record with a zero timestamp is an unused gap left by a rebuild.
+CATALOG_MAGIC = b"ADVSAVE1"
+HEADER_SIZE = len(CATALOG_MAGIC)
+NAME_BYTES = 32
+SLOT_BYTES = 32
+RECORD = struct.Struct(f"<{NAME_BYTES}s{SLOT_BYTES}sdiihhI")
+BODY_PATTERN = re.compile(r"slot_(\d{6})\.json")
+
+def field_fits(text: str, size: int) -> bool:
+    return len(text.encode("utf-8")) <= size
+
+def encode_field(text: str, size: int) -> bytes:
+    """Encode text as UTF-8, refusing text longer than size bytes.
+
+    Names are never truncated: a shared prefix would make two players (or two
+    slots) share one index record and overwrite each other's saves.
+    """
+    raw = text.encode("utf-8")
+    if len(raw) > size:
+        raise ValueError(f"'{text}' is longer than {size} bytes")
+    return raw
+
+def decode_field(raw: bytes) -> str:
+    return raw.rstrip(b"\0").decode("utf-8", "ignore")
+
+def catalog_folder(catalog: str) -> str:
+    return os.path.dirname(catalog) or "."
+
+def body_path(number: int, folder: str = SAVE_FOLDER) -> str:
+    return os.path.join(folder, f"slot_{number:06d}.json")
+
+# ----- Save Entry -----
+@dataclass
+class SaveEntry:
+    name: str
+    slot: str
+    timestamp: float
+    health: int
+    gold: int
+    location: Tuple[int, int]
+    number: int
+    folder: str = SAVE_FOLDER
+
+    @property
+    def path(self) -> str:
+        return body_path(self.number, self.folder)
+
+    def describe(self) -> str:
+        when = time.strftime("%Y-%m-%d %H:%M", time.localtime(self.timestamp))
+        return (f"{self.slot} - {when} | HP: {self.health} | Gold: {self.gold} "
+                f"| Location: {self.location}")
+
+    def pack(self) -> bytes:
+        """Encode as an index record. Raises ValueError if a field does not fit."""
+        try:
+            return RECORD.pack(
+                encode_field(self.name, NAME_BYTES), encode_field(self.slot, SLOT_BYTES),
+                self.timestamp, self.health, self.gold, self.location[0], self.location[1], self.number,
+            )
+        except struct.error as e:
+            raise ValueError(f"save does not fit the catalog record ({e})") from e
+
+def entry_from_record(record: tuple, folder: str = SAVE_FOLDER) -> SaveEntry:
+    name, slot, timestamp, health, gold, x, y, number = record
+    return SaveEntry(decode_field(name), decode_field(slot), timestamp, health, gold, (x, y), number, folder)
+
+def entry_from_save(name: str, slot: str, save_data: dict, number: int,
+                    timestamp: float, folder: str = SAVE_FOLDER) -> SaveEntry:
+    x, y = save_data.get("map_state", {}).get("player_pos", (0, 0))
+    return SaveEntry(
+        name=name,
+        slot=slot,
+        timestamp=timestamp,
+        health=int(save_data.get("health", 0)),
+        gold=int(save_data.get("gold", 0)),
+        location=(int(x), int(y)),
+        number=number,
+        folder=folder,
+    )
+
+# ----- Locking -----
+@contextmanager
+def locked(f, shared: bool = False):
+    """Hold a lock on an open catalog file so concurrent saves cannot interleave."""
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+    try:
+        yield f
+    finally:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+def open_catalog(catalog: str):
+    """Open (creating if needed) a catalog for reading and in-place writes."""
+    os.makedirs(catalog_folder(catalog), exist_ok=True)
+    return os.fdopen(os.open(catalog, os.O_RDWR | os.O_CREAT, 0o644), "r+b")
+
+# ----- Reading -----
+def scan_records(f, folder: str, name: Optional[str] = None) -> List[Tuple[int, SaveEntry]]:
+    """Return (offset, entry) pairs from an open, locked catalog.
+
+    Raises ValueError if the file has no valid header. A trailing partial
+    record is ignored.
+    """
+    size = os.fstat(f.fileno()).st_size
+    if size == 0:
+        return []
+    if size < HEADER_SIZE:
+        raise ValueError("save catalog header is truncated")
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if mm[:HEADER_SIZE] != CATALOG_MAGIC:
+            raise ValueError("save catalog has a bad header")
+        if name is not None and not field_fits(name, NAME_BYTES):
+            return []
+        name_key = encode_field(name, NAME_BYTES).ljust(NAME_BYTES, b"\0") if name is not None else None
+        records = []
+        for offset in range(HEADER_SIZE, size - RECORD.size + 1, RECORD.size):
+            # Compare the fixed-width name field before unpacking the full record.
+            if name_key is not None and mm[offset:offset + NAME_BYTES] != name_key:
+                continue
+            entry = entry_from_record(RECORD.unpack_from(mm, offset), folder)
+            if entry.timestamp:
+                records.append((offset, entry))
+        return records
+
+def read_records(catalog: str = CATALOG_FILENAME, name: Optional[str] = None) -> List[Tuple[int, SaveEntry]]:
+    """Return (offset, entry) pairs from the index, optionally only for one player."""
+    try:
+        f = open(catalog, "rb")
+    except FileNotFoundError:
+        return []
+    with f, locked(f, shared=True):
+        return scan_records(f, catalog_folder(catalog), name)
+
+def list_saves(name: Optional[str] = None, catalog: str = CATALOG_FILENAME) -> List[SaveEntry]:
+    """List save slots (newest first) without opening any save bodies."""
+    entries = [entry for _, entry in read_records(catalog, name)]
+    entries.sort(key=lambda e: e.timestamp, reverse=True)
+    return entries
+
+# ----- Writing -----
+def write_body(path: str, body: dict) -> None:
+    """Write a save body atomically so a crash never leaves half a file."""
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(body, f, indent=4)
+    os.replace(tmp, path)
+
+def rebuild_records(f, folder: str) -> None:
+    """Rewrite an open, locked catalog from the save bodies in folder."""
+    entries: Dict[int, bytes] = {}
+    for filename in os.listdir(folder):
+        match = BODY_PATTERN.fullmatch(filename)
+        if not match:
+            continue
+        path = os.path.join(folder, filename)
+        try:
+            with open(path, "r") as body:
+                data = json.load(body)
+            meta = data["catalog"]
+            number = int(match.group(1))
+            entry = entry_from_save(meta["name"], meta["slot"], data, number,
+                                    os.path.getmtime(path), folder)
+            entries[number] = entry.pack()
+        except (OSError, ValueError, KeyError, TypeError):
+            continue
+
+    f.seek(0)
+    f.truncate()
+    f.write(CATALOG_MAGIC)
+    for number in range(max(entries, default=-1) + 1):
+        f.write(entries.get(number, bytes(RECORD.size)))
+    f.flush()
+
+def rebuild_catalog(catalog: str = CATALOG_FILENAME) -> int:
+    """Rebuild a damaged index from its save bodies. Returns how many saves were recovered."""
+    with open_catalog(catalog) as f, locked(f):
+        rebuild_records(f, catalog_folder(catalog))
+        return len(scan_records(f, catalog_folder(catalog)))
+
+def write_save(name: str, slot: str, save_data: dict, catalog: str = CATALOG_FILENAME) -> SaveEntry:
+    """Write a save body and add or update its index record.
+
+    The catalog stays exclusively locked from the lookup until the record is
+    written, so concurrent saves get distinct slots. A missing or damaged
+    header is repaired by rebuilding the index from the save bodies. Raises
+    ValueError if the name, slot or stats do not fit an index record.
+    """
+    if not field_fits(name, NAME_BYTES):
+        raise ValueError(f"player names are limited to {NAME_BYTES} bytes")
+    if not field_fits(slot, SLOT_BYTES):
+        raise ValueError(f"slot names are limited to {SLOT_BYTES} bytes")
+    folder = catalog_folder(catalog)
+    with open_catalog(catalog) as f, locked(f):
+        try:
+            existing = scan_records(f, folder, name)
+            if os.fstat(f.fileno()).st_size < HEADER_SIZE:
+                rebuild_records(f, folder)
+        except ValueError:
+            rebuild_records(f, folder)
+            existing = scan_records(f, folder, name)
+
+        match = next(((off, e) for off, e in existing if e.slot == slot), None)
+        if match is not None:
+            offset, number = match[0], match[1].number
+        else:
+            # Drop any partial record left by a crash so appends stay aligned.
+            count = (os.fstat(f.fileno()).st_size - HEADER_SIZE) // RECORD.size
+            f.truncate(HEADER_SIZE + count * RECORD.size)
+            offset, number = HEADER_SIZE + count * RECORD.size, count
+
+        entry = entry_from_save(name, slot, save_data, number, time.time(), folder)
+        record = entry.pack()
+        write_body(entry.path, {"catalog": {"name": entry.name, "slot": entry.slot}, **save_data})
+        f.seek(offset)
+        f.write(record)
+        f.flush()
+    return entry
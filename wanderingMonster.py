@@ -19,19 +19,47 @@ Imp_img: pygame.Surface | None = None
 MEDIA_FOLDER = "combat_media"
 DEFAULT_TILE_SIZE = 32
 
+# ----- Scaled Sprite Cache -----
+# Keyed by (filename, tile_size) so each size is only scaled once.
+SPRITE_CACHE: Dict[Tuple[str, int], pygame.Surface] = {}
+
+def get_scaled_image(filename: str, tile_size: int = DEFAULT_TILE_SIZE) -> pygame.Surface:
+    """Load an image from the media folder scaled to tile size, reusing cached copies."""
+    key = (filename, tile_size)
+    img = SPRITE_CACHE.get(key)
+    if img is None:
+        img = pygame.image.load(os.path.join(MEDIA_FOLDER, filename)).convert_alpha()
+        img = pygame.transform.scale(img, (tile_size, tile_size))
+        SPRITE_CACHE[key] = img
+    return img
+
+def evict_sprite_sizes(keep_sizes: set[int]) -> List[pygame.Surface]:
+    """Drop cached sprites whose tile size is not in keep_sizes. Returns the evicted surfaces.
+
+    Monster image globals pointing at an evicted surface are cleared too, so the
+    surface is actually freed; load_monster_images reloads them when needed.
+    """
+    global Gnome_img, Troll_img, Imp_img
+    stale = [key for key in SPRITE_CACHE if key[1] not in keep_sizes]
+    evicted = [SPRITE_CACHE.pop(key) for key in stale]
+    if any(Gnome_img is s for s in evicted): Gnome_img = None
+    if any(Troll_img is s for s in evicted): Troll_img = None
+    if any(Imp_img is s for s in evicted): Imp_img = None
+    return evicted
+
+def live_sprites() -> List[pygame.Surface]:
+    """Every sprite surface this module keeps alive (cache plus image globals)."""
+    surfaces = list(SPRITE_CACHE.values()) + [Gnome_img, Troll_img, Imp_img]
+    return [s for s in surfaces if s is not None]
+
 # ----- Image Loading Functions -----
 def load_monster_images(tile_size: int = DEFAULT_TILE_SIZE) -> None:
     """Load and scale monster images."""
     global Gnome_img, Troll_img, Imp_img
     try:
-        Gnome_img = pygame.image.load(os.path.join(MEDIA_FOLDER, "DarkTroll.png")).convert_alpha()
-        Troll_img = pygame.image.load(os.path.join(MEDIA_FOLDER, "Beast.png")).convert_alpha()
-        Imp_img   = pygame.image.load(os.path.join(MEDIA_FOLDER, "Devil.png")).convert_alpha()
-
-        # Scale images to tile size
-        Gnome_img = pygame.transform.scale(Gnome_img, (tile_size, tile_size))
-        Troll_img = pygame.transform.scale(Troll_img, (tile_size, tile_size))
-        Imp_img   = pygame.transform.scale(Imp_img, (tile_size, tile_size))
+        Gnome_img = get_scaled_image("DarkTroll.png", tile_size)
+        Troll_img = get_scaled_image("Beast.png", tile_size)
+        Imp_img   = get_scaled_image("Devil.png", tile_size)
 
         print("Monster images loaded successfully!")
     except FileNotFoundError: